@@ -18,6 +18,39 @@ import numpy as np
 import sys
 from typing import List, Dict, Any, Callable
 
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Executa demonstrações do otimizador Nelder-Mead a partir de uma lista de problemas.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        "--save", action="store_true",
+        help="Salva animações em .mp4 e históricos em .csv nos diretórios 2d/ ou 3d/."
+    )
+    parser.add_argument(
+        "--noshow", action="store_true",
+        help="Não exibe janelas interativas do Matplotlib (útil com --save)."
+    )
+    return parser.parse_args()
+
+
+# ---------------------------------------------------------------------------
+# Seleção de backend do Matplotlib
+# ---------------------------------------------------------------------------
+# Precisa acontecer ANTES do primeiro import que toca o matplotlib (feito
+# indiretamente por nelder_mead): em modo batch (--noshow) o backend Agg
+# evita carregar bibliotecas GUI (Qt/Tk) e inicializar event loops.
+if __name__ == "__main__":
+    _ARGS: argparse.Namespace | None = _parse_args()
+    if _ARGS.noshow:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        matplotlib.rcParams["savefig.bbox"] = "tight"
+else:
+    _ARGS = None
+
 # ---------------------------------------------------------------------------
 # Importa as classes e funções do módulo nelder_mead
 # ---------------------------------------------------------------------------
@@ -26,6 +59,7 @@ try:
         NelderMeadOptimizer,
         SimplexVisualizer2D,
         SimplexVisualizer3D,
+        njit,
         run_problem,
     )
 except ImportError as exc:
@@ -35,42 +69,130 @@ except ImportError as exc:
         f"Detalhes: {exc}"
     )
 
+# joblib é opcional: permite rodar os problemas (independentes entre si)
+# em paralelo quando não há janelas interativas envolvidas.
+try:
+    from joblib import Parallel, delayed
+
+    _JOBLIB_AVAILABLE = True
+except ImportError:
+    _JOBLIB_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # Funções-objetivo de teste
 # ---------------------------------------------------------------------------
+# Cada função é decorada com @njit para que o Numba (quando instalado) a
+# inline dentro do laço compilado do otimizador; sem numba o decorador é
+# neutro e as funções rodam em Python puro. Indexação explícita (point[0])
+# em vez de desempacotamento, pois o Numba não desempacota ndarrays.
 
+@njit(cache=True)
 def booth(point: np.ndarray) -> float:
     """Função de Booth (mínimo global em (1, 3) com f=0)."""
-    x, y = point
+    x, y = point[0], point[1]
     return (x + 2 * y - 7) ** 2 + (2 * x + y - 5) ** 2
 
+@njit(cache=True)
 def sphere3d(point: np.ndarray) -> float:
     """Função esfera (mínimo global na origem)."""
     return np.sum(np.square(point))
 
+@njit(cache=True)
 def rosenbrock(point: np.ndarray, a: float = 1.0, b: float = 100.0) -> float:
     """Clássica função de Rosenbrock em 2D."""
-    x, y = point
+    x, y = point[0], point[1]
     return (a - x)**2 + b * (y - x**2)**2
 
+@njit(cache=True)
 def shifted_sphere3d(point: np.ndarray) -> float:
     """Função esfera deslocada (mínimo global em (1, -2, 0.5) com f=0)."""
     offset = np.array([1.0, -2.0, 0.5])
     return np.sum(np.square(point - offset))
 
+@njit(cache=True)
 def himmelblau(point: np.ndarray) -> float:
     """Função de Himmelblau (4 mínimos em (3,2), (-2.8,3.1), (-3.7,-3.2), (3.5,-1.8)). f=0"""
-    x, y = point
+    x, y = point[0], point[1]
     term1 = (x**2 + y - 11)**2
     term2 = (x + y**2 - 7)**2
     return term1 + term2
 
+@njit(cache=True)
 def paraboloid3d(point: np.ndarray) -> float:
     """Paraboloide simples: f(x,y,z) = x² + y² + z² (igual à sphere3d, mas com outro nome/simplex)"""
     # É a mesma função sphere3d, mas podemos usar um simplex inicial diferente
     return np.sum(np.square(point))
 
 
+# ---------------------------------------------------------------------------
+# Variantes vetorizadas ("batched") das funções-objetivo
+# ---------------------------------------------------------------------------
+# Recebem um array (..., n) de pontos e devolvem todos os valores em uma única
+# passada NumPy, eliminando as n+1 chamadas Python por iteração do otimizador.
+
+def booth_batched(P: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de ``booth``."""
+    x, y = P[..., 0], P[..., 1]
+    return (x + 2 * y - 7) ** 2 + (2 * x + y - 5) ** 2
+
+def sphere3d_batched(P: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de ``sphere3d``."""
+    return np.einsum("...i,...i->...", P, P)
+
+def rosenbrock_batched(P: np.ndarray, a: float = 1.0, b: float = 100.0) -> np.ndarray:
+    """Versão vetorizada de ``rosenbrock``."""
+    x, y = P[..., 0], P[..., 1]
+    return (a - x)**2 + b * (y - x**2)**2
+
+def shifted_sphere3d_batched(P: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de ``shifted_sphere3d``."""
+    diff = P - np.array([1.0, -2.0, 0.5])
+    return np.einsum("...i,...i->...", diff, diff)
+
+def himmelblau_batched(P: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de ``himmelblau``."""
+    x, y = P[..., 0], P[..., 1]
+    return (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+
+def paraboloid3d_batched(P: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de ``paraboloid3d``."""
+    return np.einsum("...i,...i->...", P, P)
+
+
+# ---------------------------------------------------------------------------
+# Versões AOT pré-compiladas (opcional)
+# ---------------------------------------------------------------------------
+# `python objectives_aot.py` gera a extensão nativa `objectives_compiled`;
+# quando presente, substitui as definições acima com código já compilado —
+# sem o warmup do JIT na primeira chamada de cada processo.
+
+def _wrap_batched_aot(aot_fn: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+    """Adapta a assinatura AOT (m, n) -> (m,) para grades (..., n)."""
+    def wrapped(P: np.ndarray) -> np.ndarray:
+        flat = np.ascontiguousarray(P, dtype=np.float64).reshape(-1, P.shape[-1])
+        return aot_fn(flat).reshape(P.shape[:-1])
+    return wrapped
+
+try:
+    import objectives_compiled as _aot
+
+    booth = _aot.booth
+    sphere3d = _aot.sphere3d
+    rosenbrock = _aot.rosenbrock
+    shifted_sphere3d = _aot.shifted_sphere3d
+    himmelblau = _aot.himmelblau
+    paraboloid3d = _aot.paraboloid3d
+    booth_batched = _wrap_batched_aot(_aot.booth_batched)
+    sphere3d_batched = _wrap_batched_aot(_aot.sphere3d_batched)
+    rosenbrock_batched = _wrap_batched_aot(_aot.rosenbrock_batched)
+    shifted_sphere3d_batched = _wrap_batched_aot(_aot.shifted_sphere3d_batched)
+    himmelblau_batched = _wrap_batched_aot(_aot.himmelblau_batched)
+    paraboloid3d_batched = _wrap_batched_aot(_aot.paraboloid3d_batched)
+    print("[i] Usando funções-objetivo AOT (objectives_compiled).")
+except ImportError:
+    pass  # extensão não compilada: segue com as definições Python/JIT acima
+
+
 # ---------------------------------------------------------------------------
 # Definição dos Problemas a serem Resolvidos
 # ---------------------------------------------------------------------------
@@ -80,6 +202,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Booth_2D",
         "func": booth,
+        "batched_func": booth_batched,
         "simplex0": np.array([[0.0, 0.0], [4.0, 0.0], [0.0, 4.0]]),
         "dim": 2,
         "bounds": [(-10.0, 10.0), (-10.0, 10.0)],
@@ -89,6 +212,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Sphere_3D",
         "func": sphere3d,
+        "batched_func": sphere3d_batched,
         "simplex0": np.array([
             [5.0, -3.0, 2.0],
             [5.05, -3.0, 2.0],
@@ -103,6 +227,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Rosenbrock_2D",
         "func": rosenbrock,
+        "batched_func": rosenbrock_batched,
         "simplex0": np.array([[-1.2, 1.0], [0.0, 1.2], [-1.0, 0.8]]),
         "dim": 2,
         "bounds": [(-2.0, 2.0), (-1.0, 3.0)],
@@ -112,6 +237,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Shifted_Sphere_3D",
         "func": shifted_sphere3d,
+        "batched_func": shifted_sphere3d_batched,
         "simplex0": np.array([
             [-1.0, -1.0, -1.0],
             [-0.9, -1.0, -1.0],
@@ -126,6 +252,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Himmelblau_2D",
         "func": himmelblau,
+        "batched_func": himmelblau_batched,
         "simplex0": np.array([[-1.0, 1.0], [1.0, -1.0], [-1.0, -1.0]]),
         "dim": 2,
         "bounds": [(-6.0, 6.0), (-6.0, 6.0)],
@@ -135,6 +262,7 @@ PROBLEMS: List[Dict[str, Any]] = [
     {
         "name": "Paraboloid_3D",
         "func": paraboloid3d,
+        "batched_func": paraboloid3d_batched,
         "simplex0": np.array([
             [-4.0, -4.0, -4.0],
             [-3.9, -4.0, -4.0],
@@ -153,20 +281,9 @@ PROBLEMS: List[Dict[str, Any]] = [
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    parser = argparse.ArgumentParser(
-        description="Executa demonstrações do otimizador Nelder-Mead a partir de uma lista de problemas.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    parser.add_argument(
-        "--save", action="store_true",
-        help="Salva animações em .mp4 e históricos em .csv nos diretórios 2d/ ou 3d/."
-    )
-    parser.add_argument(
-        "--noshow", action="store_true",
-        help="Não exibe janelas interativas do Matplotlib (útil com --save)."
-    )
-
-    args = parser.parse_args()
+    # Os argumentos já foram lidos no topo do módulo (antes da escolha do
+    # backend); reparseia apenas se main() for chamado programaticamente.
+    args = _ARGS if _ARGS is not None else _parse_args()
     save_outputs = args.save
     show_plots = not args.noshow
 
@@ -178,11 +295,22 @@ def main() -> None:
     print("=" * 70)
 
     num_problems = len(PROBLEMS)
-    for i, problem_config in enumerate(PROBLEMS):
-        print(f"Processando problema {i+1}/{num_problems}: {problem_config.get('name', 'NOME_NAO_DEFINIDO')}")
-        run_problem(problem_config, save=save_outputs, show=show_plots)
-        if i < num_problems - 1:
-             print("-" * 70)
+    # Cada problema é totalmente independente (otimizador, figura e arquivos
+    # próprios), então em modo batch (--noshow) eles podem rodar em paralelo.
+    # Janelas interativas do Matplotlib não sobrevivem ao fork/pickle dos
+    # workers, portanto o modo com exibição continua sequencial.
+    if not show_plots and _JOBLIB_AVAILABLE and num_problems > 1:
+        print(f"Processando {num_problems} problemas em paralelo (joblib)...")
+        Parallel(n_jobs=-1, backend="loky")(
+            delayed(run_problem)(cfg, save=save_outputs, show=False)
+            for cfg in PROBLEMS
+        )
+    else:
+        for i, problem_config in enumerate(PROBLEMS):
+            print(f"Processando problema {i+1}/{num_problems}: {problem_config.get('name', 'NOME_NAO_DEFINIDO')}")
+            run_problem(problem_config, save=save_outputs, show=show_plots)
+            if i < num_problems - 1:
+                 print("-" * 70)
 
     print("=" * 70)
     print("Demonstrações concluídas.")
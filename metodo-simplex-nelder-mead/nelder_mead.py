@@ -14,6 +14,9 @@ from __future__ import annotations
 from typing import Callable, List, Tuple, cast, Dict, Any
 
 import argparse
+import atexit
+import hashlib
+import subprocess
 import sys
 import csv
 from pathlib import Path
@@ -27,11 +30,151 @@ from matplotlib.patches import Polygon
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
+# ---------------------------------------------------------------------------
+# Numba é opcional: quando disponível, o laço principal roda compilado (LLVM).
+# Sem numba, tudo funciona em Python puro com a mesma semântica.
+# ---------------------------------------------------------------------------
+try:
+    from numba import njit
+    from numba.core.dispatcher import Dispatcher as _NumbaDispatcher
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - ambiente sem numba
+    _NUMBA_AVAILABLE = False
+    _NumbaDispatcher = ()  # isinstance(x, ()) é sempre False
+
+    def njit(*args, **kwargs):
+        """Substituto do ``numba.njit`` que devolve a função original."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
 # =====================================================
 # Núcleo: Nelder–Mead genérico
 # =====================================================
 
 
+@njit(cache=True)
+def _nm_eval_and_sort(simplex, values, f, row) -> None:
+    """Avalia ``f`` em cada vértice e ordena o simplex in-place (crescente).
+
+    Usa ordenação por inserção: o simplex tem apenas n+1 linhas, então
+    poucos compares/trocas custam menos que ``np.argsort`` + fancy-index.
+    """
+    nVerts, n = simplex.shape
+    for i in range(nVerts):
+        values[i] = f(simplex[i])
+    for i in range(1, nVerts):
+        j = i
+        while j > 0 and values[j] < values[j - 1]:
+            tmp = values[j]
+            values[j] = values[j - 1]
+            values[j - 1] = tmp
+            for k in range(n):
+                row[k] = simplex[j, k]
+                simplex[j, k] = simplex[j - 1, k]
+                simplex[j - 1, k] = row[k]
+            j -= 1
+
+
+@njit(cache=True)
+def _nm_core(
+    simplex, f, alpha, gamma, rho, sigma, maxIter, tol, history_out, best_out
+):
+    """Laço principal do Nelder–Mead em forma compilável pelo Numba.
+
+    Opera in-place sobre ``simplex`` e grava cada iteração em
+    ``history_out`` (pré-alocado com ``maxIter + 2`` quadros), com o
+    melhor valor de f de cada quadro em ``best_out``.
+    Retorna ``(nHist, bestValue)``: número de quadros gravados e o
+    valor da função no melhor vértice final.
+    """
+    nVerts, n = simplex.shape
+    values = np.empty(nVerts)
+    centroid = np.empty(n)
+    reflected = np.empty(n)
+    expanded = np.empty(n)
+    contracted = np.empty(n)
+    row = np.empty(n)
+
+    nHist = 0
+    converged = False
+    for _ in range(maxIter):
+        _nm_eval_and_sort(simplex, values, f, row)
+        for a in range(nVerts):
+            for b in range(n):
+                history_out[nHist, a, b] = simplex[a, b]
+        best_out[nHist] = values[0]
+        nHist += 1
+
+        # values já está ordenado: a amplitude f_pior - f_melhor é um
+        # critério O(1) equivalente ao desvio-padrão para detectar colapso.
+        if values[nVerts - 1] - values[0] < tol:
+            converged = True
+            break
+
+        # Centróide dos n melhores vértices (acumulação manual: o Numba
+        # compila este laço melhor do que np.mean em arrays minúsculos).
+        for b in range(n):
+            acc = 0.0
+            for a in range(nVerts - 1):
+                acc += simplex[a, b]
+            centroid[b] = acc / (nVerts - 1)
+
+        # Reflexão --------------------------------------------------
+        for b in range(n):
+            reflected[b] = centroid[b] + alpha * (centroid[b] - simplex[nVerts - 1, b])
+        fReflected = f(reflected)
+
+        if values[0] <= fReflected < values[nVerts - 2]:
+            for b in range(n):
+                simplex[nVerts - 1, b] = reflected[b]
+            continue
+
+        # Expansão --------------------------------------------------
+        if fReflected < values[0]:
+            for b in range(n):
+                expanded[b] = centroid[b] + gamma * (reflected[b] - centroid[b])
+            fExpanded = f(expanded)
+            if fExpanded < fReflected:
+                for b in range(n):
+                    simplex[nVerts - 1, b] = expanded[b]
+            else:
+                for b in range(n):
+                    simplex[nVerts - 1, b] = reflected[b]
+            continue
+
+        # Contração -----------------------------------------------
+        for b in range(n):
+            contracted[b] = centroid[b] + rho * (simplex[nVerts - 1, b] - centroid[b])
+        fContracted = f(contracted)
+        if fContracted < values[nVerts - 1]:
+            for b in range(n):
+                simplex[nVerts - 1, b] = contracted[b]
+            continue
+
+        # Redução (o vértice 0 é o melhor e não muda) ---------------
+        for a in range(1, nVerts):
+            for b in range(n):
+                simplex[a, b] = simplex[0, b] + sigma * (simplex[a, b] - simplex[0, b])
+
+    # Na convergência o simplex já está ordenado e gravado; só o término
+    # por maxIter (simplex alterado após a última ordenação) precisa de um
+    # passo final de avaliação + ordenação.
+    if not converged:
+        _nm_eval_and_sort(simplex, values, f, row)
+        for a in range(nVerts):
+            for b in range(n):
+                history_out[nHist, a, b] = simplex[a, b]
+        best_out[nHist] = values[0]
+        nHist += 1
+    return nHist, values[0]
+
+
 class NelderMeadOptimizer:
     """Implementa o algoritmo Nelder–Mead para *qualquer* dimensão.
 
@@ -46,7 +189,17 @@ class NelderMeadOptimizer:
     maxIter : int
         Iterações máximas.
     tol : float
-        Critério de parada (desvio‑padrão dos valores de f no simplex).
+        Critério de parada (amplitude f_pior − f_melhor no simplex).
+    batched_func : Callable[[np.ndarray], np.ndarray], optional
+        Variante vetorizada da função objetivo: recebe um array (m, n) e
+        devolve os m valores em uma única passada NumPy. Quando fornecida,
+        substitui as n+1 chamadas Python de ``np.apply_along_axis`` por
+        uma única chamada por iteração.
+    speculative : bool
+        Se True (e houver ``batched_func``), avalia reflexão e expansão
+        juntas em uma única chamada em lote antes de ramificar. O trabalho
+        extra no ponto expandido compensa quando a função objetivo é cara;
+        para funções baratas o padrão sequencial (False) é preferível.
     """
 
     def __init__(
@@ -60,8 +213,12 @@ class NelderMeadOptimizer:
         sigma: float = 0.5,
         maxIter: int = 200,
         tol: float = 1e-6,
+        batched_func: Callable[[np.ndarray], np.ndarray] | None = None,
+        speculative: bool = False,
     ) -> None:
         self.func = func
+        self.batched_func = batched_func
+        self.speculative = speculative
         self.simplex = initialSimplex.astype(float)
         self.n = self.simplex.shape[1]
         self.alpha = alpha
@@ -70,22 +227,96 @@ class NelderMeadOptimizer:
         self.sigma = sigma
         self.maxIter = maxIter
         self.tol = tol
-        self.history: List[np.ndarray] = []
+
+        # Buffers reutilizados pelo laço principal: o histórico inteiro vive
+        # em um único bloco contíguo (maxIter iterações + quadro final) e os
+        # pontos candidatos são escritos in-place a cada iteração, em vez de
+        # alocar arrays novos no heap.
+        n = self.n
+        self._history_buf = np.empty((maxIter + 2, n + 1, n))
+        self._centroid_buf = np.empty(n)
+        self._reflected_buf = np.empty(n)
+        self._expanded_buf = np.empty(n)
+        self._contracted_buf = np.empty(n)
+        self._tmp_buf = np.empty(n)
+        self._best_buf = np.empty(maxIter + 2)
+        self._order_buf = np.empty_like(self.simplex)
+        self._values_buf = np.empty(n + 1)
+        self.history: np.ndarray = self._history_buf[:0]
+        # Melhor valor de f em cada quadro do histórico (já calculado pela
+        # ordenação do simplex — evita reavaliar a função no pós-processo).
+        self.best_values: np.ndarray = self._best_buf[:0]
+
+        # Especialização do centróide para as únicas dimensões usadas na
+        # prática (n=2 e n=3): meia dúzia de somas escalares desenroladas
+        # custam menos que o dispatch de dtype/eixo do np.mean.
+        if n == 2:
+            self._centroid = self._centroid_n2
+        elif n == 3:
+            self._centroid = self._centroid_n3
 
     # ------------------------------------------------------------------ #
     # Métodos internos auxiliares
     # ------------------------------------------------------------------ #
 
     def _centroid(self, vertices: np.ndarray) -> np.ndarray:
-        """Calcula o centróide dos *n* melhores vértices."""
-        return np.mean(vertices[:-1], axis=0)
+        """Calcula o centróide dos *n* melhores vértices (no buffer interno).
+
+        Caminho genérico: para n=2 e n=3, ``__init__`` substitui este método
+        pelas versões desenroladas ``_centroid_n2`` / ``_centroid_n3``.
+        """
+        return np.mean(vertices[:-1], axis=0, out=self._centroid_buf)
+
+    def _centroid_n2(self, vertices: np.ndarray) -> np.ndarray:
+        """Centróide especializado para simplexes 2D (triângulos)."""
+        buf = self._centroid_buf
+        buf[0] = (vertices[0, 0] + vertices[1, 0]) * 0.5
+        buf[1] = (vertices[0, 1] + vertices[1, 1]) * 0.5
+        return buf
+
+    def _centroid_n3(self, vertices: np.ndarray) -> np.ndarray:
+        """Centróide especializado para simplexes 3D (tetraedros)."""
+        buf = self._centroid_buf
+        third = 1.0 / 3.0
+        buf[0] = (vertices[0, 0] + vertices[1, 0] + vertices[2, 0]) * third
+        buf[1] = (vertices[0, 1] + vertices[1, 1] + vertices[2, 1]) * third
+        buf[2] = (vertices[0, 2] + vertices[1, 2] + vertices[2, 2]) * third
+        return buf
+
+    def _compute_expanded(
+        self, centroid: np.ndarray, reflected: np.ndarray
+    ) -> np.ndarray:
+        """Calcula o ponto expandido no buffer interno (sem alocação)."""
+        np.subtract(reflected, centroid, out=self._tmp_buf)
+        self._tmp_buf *= self.gamma
+        return np.add(centroid, self._tmp_buf, out=self._expanded_buf)
 
     def _order_simplex(self) -> np.ndarray:
-        """Ordena o simplex pelo valor da função (crescente)."""
-        values = np.apply_along_axis(self.func, 1, self.simplex)
-        idx = np.argsort(values)
-        self.simplex = self.simplex[idx]
-        return values[idx]
+        """Ordena o simplex pelo valor da função (crescente).
+
+        O algoritmo só precisa do melhor, do segundo pior e do pior
+        vértice nas posições certas. Para os simplexes minúsculos usados
+        aqui (3–4 vértices) uma ordenação de índices em Python é mais
+        barata que ``np.argsort``; acima disso, ``np.argpartition``
+        posiciona apenas os três vértices relevantes. A reordenação usa
+        um buffer pré-alocado (troca de ponteiros) em vez de fancy-index
+        com alocação nova a cada iteração.
+        """
+        if self.batched_func is not None:
+            values = np.asarray(self.batched_func(self.simplex), dtype=float)
+        else:
+            values = np.apply_along_axis(self.func, 1, self.simplex)
+
+        nVerts = values.shape[0]
+        if nVerts <= 4:
+            idx = sorted(range(nVerts), key=values.__getitem__)
+        else:
+            idx = np.argpartition(values, (0, nVerts - 2, nVerts - 1))
+
+        np.take(self.simplex, idx, axis=0, out=self._order_buf)
+        self.simplex, self._order_buf = self._order_buf, self.simplex
+        np.take(values, idx, out=self._values_buf)
+        return self._values_buf
 
     # ------------------------------------------------------------------ #
     # Passo principal
@@ -106,19 +337,59 @@ class NelderMeadOptimizer:
             Uma tupla contendo o melhor ponto encontrado (vértice do simplex final
             com o menor valor da função) e o valor da função nesse ponto.
         """
+        # Caminho rápido: se a função objetivo já foi compilada com @njit,
+        # todo o laço roda dentro de _nm_core sem voltar ao interpretador.
+        if _NUMBA_AVAILABLE and isinstance(self.func, _NumbaDispatcher):
+            nHist, bestValue = _nm_core(
+                self.simplex,
+                self.func,
+                self.alpha,
+                self.gamma,
+                self.rho,
+                self.sigma,
+                self.maxIter,
+                self.tol,
+                self._history_buf,
+                self._best_buf,
+            )
+            self.history = self._history_buf[:nHist]
+            self.best_values = self._best_buf[:nHist]
+            return self.simplex[0].copy(), bestValue
+
+        histLen = 0
+        values = np.empty(0)
+        converged = False
         for _ in range(self.maxIter):
             values = self._order_simplex()
-            self.history.append(self.simplex.copy())
-
-            if np.std(values) < self.tol:
+            # Cópia in-place para memória já alocada (sem heap por iteração)
+            self._history_buf[histLen] = self.simplex
+            self._best_buf[histLen] = values[0]
+            histLen += 1
+
+            # values já está ordenado: amplitude em vez de np.std (que
+            # aloca temporários e faz um sqrt a cada iteração).
+            if values[-1] - values[0] < self.tol:
+                converged = True
                 break
 
             centroid = self._centroid(self.simplex)
             worst = self.simplex[-1]
 
             # Reflexão --------------------------------------------------
-            reflected = centroid + self.alpha * (centroid - worst)
-            fReflected = self.func(reflected)
+            np.subtract(centroid, worst, out=self._tmp_buf)
+            self._tmp_buf *= self.alpha
+            reflected = np.add(centroid, self._tmp_buf, out=self._reflected_buf)
+
+            speculate = self.speculative and self.batched_func is not None
+            if speculate:
+                # Avaliação especulativa: reflexão e expansão em uma única
+                # chamada em lote, antes de saber se a expansão será usada.
+                expanded = self._compute_expanded(centroid, reflected)
+                fReflected, fExpanded = self.batched_func(
+                    np.stack((reflected, expanded))
+                )
+            else:
+                fReflected = self.func(reflected)
 
             if values[0] <= fReflected < values[-2]:
                 self.simplex[-1] = reflected
@@ -126,28 +397,202 @@ class NelderMeadOptimizer:
 
             # Expansão --------------------------------------------------
             if fReflected < values[0]:
-                expanded = centroid + self.gamma * (reflected - centroid)
-                fExpanded = self.func(expanded)
+                if not speculate:
+                    expanded = self._compute_expanded(centroid, reflected)
+                    fExpanded = self.func(expanded)
                 self.simplex[-1] = expanded if fExpanded < fReflected else reflected
                 continue
 
             # Contração -----------------------------------------------
-            contracted = centroid + self.rho * (worst - centroid)
+            np.subtract(worst, centroid, out=self._tmp_buf)
+            self._tmp_buf *= self.rho
+            contracted = np.add(centroid, self._tmp_buf, out=self._contracted_buf)
             fContracted = self.func(contracted)
             if fContracted < values[-1]:
                 self.simplex[-1] = contracted
                 continue
 
             # Redução --------------------------------------------------
+            # In-place sobre o próprio buffer do simplex (sem temporários);
+            # o vértice 0 é o melhor e não muda durante a redução.
             best = self.simplex[0]
-            self.simplex = best + self.sigma * (self.simplex - best)
+            rest = self.simplex[1:]
+            np.subtract(rest, best, out=rest)
+            rest *= self.sigma
+            rest += best
+
+        # Na convergência o simplex já saiu ordenado e gravado da última
+        # iteração; reordenar e reavaliar aqui custaria n+2 chamadas extras
+        # de f. Só o término por maxIter (simplex alterado depois da última
+        # ordenação) exige o passo final.
+        if not converged:
+            values = self._order_simplex()
+            self._history_buf[histLen] = self.simplex
+            self._best_buf[histLen] = values[0]
+            histLen += 1
+        self.history = self._history_buf[:histLen]
+        self.best_values = self._best_buf[:histLen]
+        # values[0] já é f(simplex[0]): devolve sem reavaliar a função
+        return self.simplex[0], float(values[0])
+
+
+# =====================================================
+# Cache de fundos de visualização
+# =====================================================
+# A grade Z de um fundo depende apenas de (função, bounds, resolução); esse
+# conjunto se repete quando o mesmo problema é visualizado mais de uma vez
+# (ex.: --save seguido de exibição interativa) ou entre execuções do programa.
+
+_BACKGROUND_CACHE: Dict[Tuple[Any, ...], np.ndarray] = {}
+_BACKGROUND_CACHE_DIR = Path(".cache")
 
-        # Guardar estado final
-        self._order_simplex()
-        self.history.append(self.simplex.copy())
-        bestPoint = self.simplex[0]
-        bestValue = self.func(bestPoint)
-        return bestPoint, bestValue
+
+def _cached_background(
+    func: Callable[[np.ndarray], float],
+    bounds: List[Tuple[float, float]],
+    resolution: int,
+    compute: Callable[[], np.ndarray],
+) -> np.ndarray:
+    """Devolve a grade Z do fundo, reutilizando cálculos anteriores.
+
+    Em memória a chave usa ``id(func)`` (mesma função dentro do processo);
+    em disco (``.cache/``) usa o nome da função, de modo que execuções
+    repetidas do programa também pulem o recálculo.
+    """
+    boundsKey = tuple((float(lo), float(hi)) for lo, hi in bounds)
+    memKey = (id(func), boundsKey, resolution)
+    if memKey in _BACKGROUND_CACHE:
+        return _BACKGROUND_CACHE[memKey]
+
+    name = getattr(func, "__name__", None)
+    diskPath: Path | None = None
+    if name:
+        digest = hashlib.md5(repr((name, boundsKey, resolution)).encode()).hexdigest()
+        diskPath = _BACKGROUND_CACHE_DIR / f"{name}_{digest}.npy"
+        if diskPath.exists():
+            try:
+                Z = np.load(diskPath)
+                _BACKGROUND_CACHE[memKey] = Z
+                return Z
+            except (OSError, ValueError):
+                pass  # cache corrompido: recalcula e sobrescreve
+
+    Z = compute()
+    _BACKGROUND_CACHE[memKey] = Z
+    if diskPath is not None:
+        try:
+            _BACKGROUND_CACHE_DIR.mkdir(exist_ok=True)
+            np.save(diskPath, Z)
+        except OSError:
+            pass  # cache em disco é melhor-esforço
+    return Z
+
+
+# =====================================================
+# Escrita de MP4: codec por hardware quando disponível
+# =====================================================
+# A codificação do MP4 domina o tempo de --save. Se o ffmpeg local expõe o
+# encoder NVENC (GPU NVIDIA), usamos esse; caso contrário, libx264. A sonda
+# roda no máximo uma vez por processo.
+
+_FFMPEG_CODEC: str | None = None
+_ANIM_SAVE_DPI = 80  # animações a 3 fps não precisam de 100+ DPI
+
+
+def _trial_encode(codec: str) -> bool:
+    """Verifica se o encoder abre de fato, codificando um quadro sintético."""
+    cmd = [
+        "ffmpeg", "-hide_banner", "-v", "error",
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:r=1",
+        "-frames:v", "1", "-c:v", codec, "-f", "null", "-",
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=15).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _probe_ffmpeg_codec() -> str:
+    """Devolve o codec H.264 mais rápido utilizável no ffmpeg local."""
+    try:
+        out = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return "libx264"
+    # A listagem de -encoders reflete o suporte de compilação, não o
+    # hardware presente: ffmpeg de distro lista o NVENC mesmo sem GPU
+    # NVIDIA, e abrir o encoder falharia em cada anim.save. Só adotamos
+    # o NVENC depois de uma codificação de teste de um quadro.
+    if "h264_nvenc" in out and _trial_encode("h264_nvenc"):
+        return "h264_nvenc"
+    return "libx264"
+
+
+def _decimate_frames(nFrames: int, maxFrames: int) -> np.ndarray:
+    """Seleciona até ``maxFrames`` índices de quadros, sempre incluindo o último.
+
+    Perto da convergência os simplexes adjacentes são visualmente idênticos;
+    renderizar todos só encarece o ffmpeg. A amostragem é uniforme no
+    histórico e o quadro final (destacado) é preservado.
+    """
+    if nFrames <= maxFrames:
+        return np.arange(nFrames)
+    return np.unique(np.concatenate([
+        np.linspace(0, nFrames - 1, maxFrames - 1).astype(int),
+        [nFrames - 1],
+    ]))
+
+
+def _make_mp4_writer(fps: int = 3) -> animation.FFMpegWriter:
+    """Cria o writer ffmpeg com o codec sondado e args de compatibilidade."""
+    global _FFMPEG_CODEC
+    if _FFMPEG_CODEC is None:
+        _FFMPEG_CODEC = _probe_ffmpeg_codec()
+    extra_args = ["-pix_fmt", "yuv420p"]
+    if _FFMPEG_CODEC == "h264_nvenc":
+        extra_args = ["-preset", "p1", "-pix_fmt", "yuv420p"]
+    return animation.FFMpegWriter(fps=fps, codec=_FFMPEG_CODEC, extra_args=extra_args)
+
+
+# =====================================================
+# Cache de figuras Matplotlib
+# =====================================================
+# Criar uma figura nova custa centenas de ms (inicialização de backend,
+# cache de fontes). Ao rodar vários problemas em sequência, reutilizamos
+# uma figura (e seus artistas) por tipo de visualização, limpando os eixos
+# entre problemas.
+
+_FIG_CACHE_2D: Dict[str, Any] = {}
+_FIG_CACHE_3D: Dict[str, Any] = {}
+
+
+def _release_fig_caches() -> None:
+    """Fecha as figuras reutilizadas ao encerrar o interpretador."""
+    for cache in (_FIG_CACHE_2D, _FIG_CACHE_3D):
+        fig = cache.get("fig")
+        if fig is not None:
+            plt.close(fig)
+        cache.clear()
+
+
+def _drop_stale_fig_cache(cache: Dict[str, Any]) -> None:
+    """Descarta o cache se o pyplot já não gerencia a figura.
+
+    No modo interativo, fechar a janela de ``plt.show()`` desregistra a
+    figura do pyplot; uma figura órfã nunca volta a ser exibida, então os
+    problemas seguintes mostrariam janelas vazias. Os artistas em cache
+    pertencem à figura descartada e caem junto.
+    """
+    fig = cache.get("fig")
+    if fig is not None and fig.number not in plt.get_fignums():
+        cache.clear()
+
+
+atexit.register(_release_fig_caches)
 
 
 # =====================================================
@@ -166,15 +611,33 @@ class SimplexVisualizer2D:
         *,
         levels: int = 50,
         title: str | None = None,
+        batched_func: Callable[[np.ndarray], np.ndarray] | None = None,
+        reuse_fig: bool = True,
+        anim_max_frames: int = 60,
+        rasterize_background: bool = True,
     ) -> None:
         self.func = func
+        self.batched_func = batched_func
         self.bounds = bounds
         self.history = history
         self.levels = levels
-        self.fig, self.ax = plt.subplots(figsize=(8, 6))
+        self.reuse_fig = reuse_fig
+        self.anim_max_frames = anim_max_frames
+        self.rasterize_background = rasterize_background
+        self._background_frozen = False
+        if reuse_fig:
+            _drop_stale_fig_cache(_FIG_CACHE_2D)
+        if reuse_fig and "fig" in _FIG_CACHE_2D:
+            self.fig = _FIG_CACHE_2D["fig"]
+            self.ax = _FIG_CACHE_2D["ax"]
+            self.ax.clear()
+        else:
+            self.fig, self.ax = plt.subplots(figsize=(8, 6))
+            if reuse_fig:
+                _FIG_CACHE_2D["fig"] = self.fig
+                _FIG_CACHE_2D["ax"] = self.ax
         self.ax: Axes
-        if title:
-            self.fig.suptitle(title, fontsize=14)
+        self.fig.suptitle(title or "", fontsize=14)
         self._prepare_background()
 
     def _prepare_background(self) -> None:
@@ -182,11 +645,56 @@ class SimplexVisualizer2D:
         x = np.linspace(xMin, xMax, 400)
         y = np.linspace(yMin, yMax, 400)
         X, Y = np.meshgrid(x, y)
-        Z = np.array([[self.func(np.array([xx, yy])) for xx in x] for yy in y])
+
+        def computeZ() -> np.ndarray:
+            if self.batched_func is not None:
+                # Uma única expressão NumPy sobre a grade (400, 400, 2) inteira.
+                return np.asarray(self.batched_func(np.stack((X, Y), axis=-1)))
+            # Fallback escalar: ainda são 160k chamadas Python, mas sem a
+            # dupla list-comprehension nem a alocação de array por célula.
+            P = np.stack((X, Y), axis=-1).reshape(-1, 2)
+            return np.fromiter(
+                (self.func(p) for p in P), dtype=float, count=P.shape[0]
+            ).reshape(X.shape)
+
+        Z = _cached_background(self.func, self.bounds, 400, computeZ)
         self.ax.contourf(X, Y, Z, self.levels, alpha=0.6, cmap="viridis")
         self.ax.set_xlabel("x")
         self.ax.set_ylabel("y")
 
+    def _freeze_background(self) -> None:
+        """Congela o fundo de contornos em um único bitmap.
+
+        Ao salvar MP4, cada quadro redesenha a figura inteira (~levels
+        polígonos de contorno). Substituir o contourf por um imshow do
+        próprio fundo já rasterizado deixa só o triângulo do simplex como
+        artista vetorial a redesenhar por quadro.
+        """
+        if self._background_frozen:
+            return
+        (xMin, xMax), (yMin, yMax) = self.bounds
+        self.fig.canvas.draw()
+        buf = np.asarray(self.fig.canvas.buffer_rgba())
+        bbox = self.ax.get_window_extent()
+        # buffer_rgba tem origem no canto superior esquerdo; o bbox dos
+        # eixos usa origem inferior esquerda — converte e recorta.
+        h = buf.shape[0]
+        r0, r1 = int(round(h - bbox.y1)), int(round(h - bbox.y0))
+        c0, c1 = int(round(bbox.x0)), int(round(bbox.x1))
+        crop = buf[r0:r1, c0:c1].copy()
+        self.ax.clear()
+        self.ax.imshow(
+            crop,
+            extent=(xMin, xMax, yMin, yMax),
+            origin="upper",
+            aspect="auto",
+            interpolation="nearest",
+            zorder=0,
+        )
+        self.ax.set_xlabel("x")
+        self.ax.set_ylabel("y")
+        self._background_frozen = True
+
     def _update(self, i: int, poly):
         verts = self.history[i]
         poly.set_xy(verts)
@@ -194,23 +702,35 @@ class SimplexVisualizer2D:
         return poly,
 
     def animate(self, *, savePath: str | None = None) -> None:
-        if not self.history:
+        if len(self.history) == 0:
             print("[!] Animação 2D pulada: Histórico vazio.")
-            plt.close(self.fig)
+            if not self.reuse_fig:
+                plt.close(self.fig)
             return
-        
-        poly = Polygon(self.history[0], fill=False, color="red", linewidth=2)
+
+        if savePath and self.rasterize_background:
+            self._freeze_background()
+
+        poly = _FIG_CACHE_2D.get("poly") if self.reuse_fig else None
+        if poly is None:
+            poly = Polygon(self.history[0], fill=False, color="red", linewidth=2)
+            if self.reuse_fig:
+                _FIG_CACHE_2D["poly"] = poly
+        else:
+            # Artista reaproveitado do problema anterior: só atualiza a geometria
+            poly.set_xy(self.history[0])
+            poly.set_edgecolor("red")
         self.ax.add_patch(poly)
         anim = animation.FuncAnimation(
             self.fig,
             self._update,
             fargs=(poly,),
-            frames=len(self.history),
+            frames=_decimate_frames(len(self.history), self.anim_max_frames),
             interval=300,
             blit=True,
         )
         if savePath:
-            anim.save(savePath, writer="ffmpeg", fps=3)
+            anim.save(savePath, writer=_make_mp4_writer(fps=3), dpi=_ANIM_SAVE_DPI)
         else:
             plt.show()
 
@@ -231,34 +751,64 @@ class SimplexVisualizer3D:
         *,
         showSurface: bool = True,
         title: str | None = None,
+        batched_func: Callable[[np.ndarray], np.ndarray] | None = None,
+        reuse_fig: bool = True,
+        anim_max_frames: int = 60,
     ) -> None:
         self.func = func
+        self.batched_func = batched_func
         self.bounds = bounds
         self.history = history
         self.showSurface = showSurface
+        self.reuse_fig = reuse_fig
+        self.anim_max_frames = anim_max_frames
+        # Conectividade fixa das 4 faces triangulares de um tetraedro:
+        # um único fancy-index tetra[_face_idx] devolve o (4, 3, 3) que o
+        # Poly3DCollection espera, sem reconstruir listas a cada quadro.
+        self._face_idx = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]])
 
         # ---------- figura e eixo ----------
-        self.fig = plt.figure(figsize=(8, 6))
-        if title:
-            self.fig.suptitle(title, fontsize=14)
         # Declara o tipo primeiro
         self.ax: Axes3D
-        # Depois atribui, usando cast para o linter
-        self.ax = cast(Axes3D, self.fig.add_subplot(111, projection="3d"))
+        if reuse_fig:
+            _drop_stale_fig_cache(_FIG_CACHE_3D)
+        if reuse_fig and "fig" in _FIG_CACHE_3D:
+            self.fig = _FIG_CACHE_3D["fig"]
+            self.ax = _FIG_CACHE_3D["ax"]
+            self.ax.clear()
+        else:
+            self.fig = plt.figure(figsize=(8, 6))
+            # Atribui usando cast para o linter
+            self.ax = cast(Axes3D, self.fig.add_subplot(111, projection="3d"))
+            if reuse_fig:
+                _FIG_CACHE_3D["fig"] = self.fig
+                _FIG_CACHE_3D["ax"] = self.ax
+        self.fig.suptitle(title or "", fontsize=14)
         self._setup_axes()
         if self.showSurface:
             self._plot_surface()
 
         # ---------- cria UM Poly3DCollection (será atualizado) ----------
-        if not self.history:
+        if len(self.history) == 0:
             print("[!] Poly3DCollection não criado: Histórico vazio.")
             self.poly = None
         else:
-            verts = self._faces(self.history[0])
-            # cor rubi bem transparente → praticamente invisível, porém válida
-            self.poly = Poly3DCollection(
-                verts, facecolor=(0.8, 0.1, 0.1, 0.25), edgecolor="red", linewidths=1
-            )
+            verts = self.history[0][self._face_idx]
+            cached_poly = _FIG_CACHE_3D.get("poly") if reuse_fig else None
+            if cached_poly is not None:
+                # Reaproveita o artista: restaura geometria e estilo padrão
+                self.poly = cached_poly
+                self.poly.set_verts(verts)
+                self.poly.set_facecolor((0.8, 0.1, 0.1, 0.25))
+                self.poly.set_edgecolor("red")
+                self.poly.set_alpha(None)
+            else:
+                # cor rubi bem transparente → praticamente invisível, porém válida
+                self.poly = Poly3DCollection(
+                    verts, facecolor=(0.8, 0.1, 0.1, 0.25), edgecolor="red", linewidths=1
+                )
+                if reuse_fig:
+                    _FIG_CACHE_3D["poly"] = self.poly
             self.ax.add_collection3d(self.poly)
 
     # ------------------------------------------------------------------ #
@@ -279,25 +829,25 @@ class SimplexVisualizer3D:
         xs = np.linspace(xMin, xMax, res)
         ys = np.linspace(yMin, yMax, res)
         xsM, ysM = np.meshgrid(xs, ys)
-        zsM = np.vectorize(
-            lambda x, y: self.func(np.array([x, y, 0.0]))
-        )(xsM, ysM)
+
+        def computeZ() -> np.ndarray:
+            if self.batched_func is not None:
+                # Grade (res, res, 3) avaliada em uma única chamada em lote.
+                P = np.stack((xsM, ysM, np.zeros_like(xsM)), axis=-1)
+                return np.asarray(self.batched_func(P))
+            # Fallback escalar (np.vectorize seria só um for disfarçado).
+            P = np.stack((xsM, ysM, np.zeros_like(xsM)), axis=-1).reshape(-1, 3)
+            return np.fromiter(
+                (self.func(p) for p in P), dtype=float, count=P.shape[0]
+            ).reshape(xsM.shape)
+
+        zsM = _cached_background(self.func, self.bounds, res, computeZ)
 
         self.ax.plot_surface(
             xsM, ysM, zsM,
             cmap="viridis", alpha=0.20, linewidth=0, antialiased=False
         )
 
-    @staticmethod
-    def _faces(tetra: np.ndarray):
-        """Retorna as quatro faces triangulares de um tetraedro."""
-        return [
-            [tetra[0], tetra[1], tetra[2]],
-            [tetra[0], tetra[1], tetra[3]],
-            [tetra[0], tetra[2], tetra[3]],
-            [tetra[1], tetra[2], tetra[3]],
-        ]
-
     # ------------------------------------------------------------------ #
     # animação
     # ------------------------------------------------------------------ #
@@ -312,7 +862,7 @@ class SimplexVisualizer3D:
             return ()
             
         tetra = self.history[frame]
-        self.poly.set_verts(self._faces(tetra))
+        self.poly.set_verts(tetra[self._face_idx])
 
         # realça o simplex final
         if frame == len(self.history) - 1:
@@ -329,15 +879,16 @@ class SimplexVisualizer3D:
         - interval: milissegundos entre quadros.
         - savePath: se fornecido, grava .mp4 via ffmpeg; caso contrário, mostra.
         """
-        if self.poly is None or not self.history:
+        if self.poly is None or len(self.history) == 0:
             print("[!] Animação 3D pulada: Histórico vazio ou Poly3DCollection não criado.")
-            plt.close(self.fig)
+            if not self.reuse_fig:
+                plt.close(self.fig)
             return
 
         ani = animation.FuncAnimation(
             self.fig,
             self._update,
-            frames=len(self.history),
+            frames=_decimate_frames(len(self.history), self.anim_max_frames),
             interval=interval,
             blit=False,        # ← blit=False é frequentemente necessário para evitar
                                #   artefatos visuais em animações 3D complexas.
@@ -345,7 +896,7 @@ class SimplexVisualizer3D:
         )
 
         if savePath:
-            ani.save(savePath, writer="ffmpeg", fps=3)
+            ani.save(savePath, writer=_make_mp4_writer(fps=3), dpi=_ANIM_SAVE_DPI)
         else:
             plt.show()
 
@@ -364,55 +915,71 @@ def run_problem(problem: Dict[str, Any], save: bool, show: bool) -> None:
     viz_params = problem.get("viz_params", {})
 
     print(f"\n[-- Executando Problema: {name} ({dim}D) --]")
-    print(f"  Função: {func.__name__}")
+    print(f"  Função: {getattr(func, '__name__', str(func))}")
     print(f"  Simplex inicial:\n{simplex0}".replace("\n", "\n  "))
 
     # Instancia e executa o otimizador
-    optimizer = NelderMeadOptimizer(func, simplex0, **opt_params)
+    optimizer = NelderMeadOptimizer(
+        func, simplex0, batched_func=problem.get("batched_func"), **opt_params
+    )
     print("\n  Otimizando...")
     best_point, best_value = optimizer.optimize()
     print(f"    -> Ponto ótimo encontrado: {best_point}")
     print(f"    -> Valor da função: {best_value:.4e}")
-    iterations = len(optimizer.history) -1 if optimizer.history else 0
+    iterations = len(optimizer.history) - 1 if len(optimizer.history) else 0
     print(f"    -> Total de iterações: {iterations}")
 
     # --- Processar histórico para tabela e CSV ---
-    if optimizer.history:
+    if len(optimizer.history):
         print("\n  Processando histórico de otimização...")
-        table_data = []
         # Define cabeçalhos dinamicamente com base na dimensão
         coord_names = [f"x{i+1}" for i in range(dim)]
         headers = ["Iteração", *coord_names, f"f({','.join(coord_names)})"]
 
-        for i, simplex in enumerate(optimizer.history):
-            best_point_iter = simplex[0]
-            value_iter = func(best_point_iter)
-            row = [i, *best_point_iter, value_iter]
-            table_data.append(row)
-
-        # Imprimir tabela no console
-        print("\n  Histórico dos Melhores Pontos por Iteração:")
-        print("  " + tabulate(table_data, headers=headers, floatfmt=".6e", tablefmt="grid").replace("\n", "\n  "))
-
-        # Salvar CSV se solicitado
+        # O melhor valor de cada iteração já foi calculado pelo otimizador
+        # (optimizer.best_values), então não reavaliamos a função aqui, e o
+        # CSV é escrito em streaming durante a única passada pelo histórico.
+        # A tabela completa só é materializada quando será exibida.
+        table_data: List[List[Any]] | None = [] if show else None
+        csv_file = None
+        csv_writer = None
+        csv_path: Path | None = None
         if save:
             output_dir = Path(f"{dim}d")
             output_dir.mkdir(parents=True, exist_ok=True)
             csv_path = output_dir / f"{name}_history.csv"
             try:
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(headers)
-                    writer.writerows(table_data)
-                print(f"\n  [+] Histórico salvo em CSV: {csv_path.resolve()}")
+                csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+                csv_writer = csv.writer(csv_file)
+                csv_writer.writerow(headers)
             except IOError as e:
                 print(f"\n  [!] Erro ao salvar CSV para {name}: {e}")
+                csv_file = None
+                csv_writer = None
+
+        try:
+            rows = zip(optimizer.history, optimizer.best_values)
+            for i, (simplex, value_iter) in enumerate(rows):
+                row = [i, *simplex[0], value_iter]
+                if csv_writer is not None:
+                    csv_writer.writerow(row)
+                if table_data is not None:
+                    table_data.append(row)
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+                print(f"\n  [+] Histórico salvo em CSV: {csv_path.resolve()}")
+
+        if table_data is not None:
+            # Imprimir tabela no console
+            print("\n  Histórico dos Melhores Pontos por Iteração:")
+            print("  " + tabulate(table_data, headers=headers, floatfmt=".6e", tablefmt="grid").replace("\n", "\n  "))
     else:
         print("\n  Nenhum histórico de otimização para processar.")
 
     # --- Visualização --- 
     if show or save:
-        if not optimizer.history:
+        if len(optimizer.history) == 0:
             print("\n  Visualização pulada (sem histórico).")
             return
         
@@ -428,10 +995,11 @@ def run_problem(problem: Dict[str, Any], save: bool, show: bool) -> None:
         try:
             # Passa o nome do problema como título para o visualizador
             common_viz_args = {
-                "func": func, 
-                "bounds": bounds, 
+                "func": func,
+                "bounds": bounds,
                 "history": optimizer.history,
-                "title": name
+                "title": name,
+                "batched_func": problem.get("batched_func"),
             }
             
             if dim == 2:
@@ -0,0 +1,140 @@
+"""objectives_aot.py
+===================
+
+Compilação AOT (ahead-of-time) das funções-objetivo com ``numba.pycc``.
+
+Uso (passo único, opcional):
+    $ python objectives_aot.py
+
+Gera a extensão nativa ``objectives_compiled`` no diretório atual. Quando
+presente, ``main.py`` a importa no lugar das definições Python, eliminando
+o custo de warmup do JIT a cada inicialização do interpretador (o JIT com
+``cache=True`` evita recompilar, mas ainda paga a primeira chamada de cada
+processo).
+
+As definições abaixo devem permanecer em sincronia com as de ``main.py``.
+As variantes ``*_batched`` recebem um array (m, n) e devolvem os m valores;
+laços explícitos compilam melhor que reduções com ``axis=`` no Numba.
+"""
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+
+try:
+    from numba.pycc import CC
+except ImportError as exc:  # numba ausente ou sem suporte a pycc
+    sys.exit(
+        "numba.pycc indisponível — instale uma versão do numba com suporte "
+        f"a AOT para compilar.\nDetalhes: {exc}"
+    )
+
+cc = CC("objectives_compiled")
+
+
+@cc.export("booth", "f8(f8[:])")
+def booth(point):
+    x, y = point[0], point[1]
+    return (x + 2 * y - 7) ** 2 + (2 * x + y - 5) ** 2
+
+
+@cc.export("booth_batched", "f8[:](f8[:, :])")
+def booth_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        x, y = P[i, 0], P[i, 1]
+        out[i] = (x + 2 * y - 7) ** 2 + (2 * x + y - 5) ** 2
+    return out
+
+
+@cc.export("sphere3d", "f8(f8[:])")
+def sphere3d(point):
+    acc = 0.0
+    for j in range(point.shape[0]):
+        acc += point[j] * point[j]
+    return acc
+
+
+@cc.export("sphere3d_batched", "f8[:](f8[:, :])")
+def sphere3d_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        acc = 0.0
+        for j in range(P.shape[1]):
+            acc += P[i, j] * P[i, j]
+        out[i] = acc
+    return out
+
+
+@cc.export("rosenbrock", "f8(f8[:])")
+def rosenbrock(point):
+    x, y = point[0], point[1]
+    return (1.0 - x) ** 2 + 100.0 * (y - x**2) ** 2
+
+
+@cc.export("rosenbrock_batched", "f8[:](f8[:, :])")
+def rosenbrock_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        x, y = P[i, 0], P[i, 1]
+        out[i] = (1.0 - x) ** 2 + 100.0 * (y - x**2) ** 2
+    return out
+
+
+@cc.export("shifted_sphere3d", "f8(f8[:])")
+def shifted_sphere3d(point):
+    dx = point[0] - 1.0
+    dy = point[1] + 2.0
+    dz = point[2] - 0.5
+    return dx * dx + dy * dy + dz * dz
+
+
+@cc.export("shifted_sphere3d_batched", "f8[:](f8[:, :])")
+def shifted_sphere3d_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        dx = P[i, 0] - 1.0
+        dy = P[i, 1] + 2.0
+        dz = P[i, 2] - 0.5
+        out[i] = dx * dx + dy * dy + dz * dz
+    return out
+
+
+@cc.export("himmelblau", "f8(f8[:])")
+def himmelblau(point):
+    x, y = point[0], point[1]
+    return (x**2 + y - 11) ** 2 + (x + y**2 - 7) ** 2
+
+
+@cc.export("himmelblau_batched", "f8[:](f8[:, :])")
+def himmelblau_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        x, y = P[i, 0], P[i, 1]
+        out[i] = (x**2 + y - 11) ** 2 + (x + y**2 - 7) ** 2
+    return out
+
+
+@cc.export("paraboloid3d", "f8(f8[:])")
+def paraboloid3d(point):
+    acc = 0.0
+    for j in range(point.shape[0]):
+        acc += point[j] * point[j]
+    return acc
+
+
+@cc.export("paraboloid3d_batched", "f8[:](f8[:, :])")
+def paraboloid3d_batched(P):
+    out = np.empty(P.shape[0])
+    for i in range(P.shape[0]):
+        acc = 0.0
+        for j in range(P.shape[1]):
+            acc += P[i, j] * P[i, j]
+        out[i] = acc
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print("[+] Extensão 'objectives_compiled' gerada com sucesso.")
@@ -1,9 +1,37 @@
-from flask import Flask, render_template, request, jsonify
+import numpy as np
+from flask import Flask, render_template, request, jsonify, Response
 
 from controllers.tank_controller import run_optimization, run_comparison
 
+# orjson serializes numpy arrays directly in C (no tolist() round trip);
+# without it, responses fall back to jsonify on listified payloads.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson not installed
+    orjson = None
+
 app = Flask(__name__)
 
+
+def _listify(obj):
+    """Recursively converts numpy arrays to lists for the jsonify fallback."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, dict):
+        return {k: _listify(v) for k, v in obj.items()}
+    return obj
+
+
+def _json_response(payload):
+    """Serializes a result payload that may contain numpy arrays."""
+    if orjson is not None:
+        return Response(
+            orjson.dumps(payload,
+                         option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json",
+        )
+    return jsonify(_listify(payload))
+
 @app.route("/")
 def index():
     """Renders the main page of the application."""
@@ -19,7 +47,7 @@ def optimize():
     if data is None:
         return jsonify({"error": "Invalid JSON payload"}), 400
     result = run_optimization(data)
-    return jsonify(result)
+    return _json_response(result)
 
 @app.route("/compare", methods=["POST"])
 def compare():
@@ -31,8 +59,8 @@ def compare():
     if data is None:
         return jsonify({"error": "Invalid JSON payload"}), 400
     result = run_comparison(data)
-    return jsonify(result)
+    return _json_response(result)
 
 if __name__ == "__main__":
     # Runs the Flask application in debug mode.
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
@@ -1,31 +1,147 @@
 """Implementations of optimization algorithms: Steepest Descent, Newton, and DFP."""
+import math
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, Callable, List, Type
 
 import numpy as np
 from numpy.typing import NDArray
 
+from models.objective import njit
+
+
+@njit(cache=True)
+def dfp_update(B: NDArray[np.float64], s: NDArray[np.float64],
+               y: NDArray[np.float64]) -> bool:
+    """Scalar-expanded DFP update of the 2x2 inverse-Hessian approximation.
+
+    Updates B in place and returns whether the update was applied; when the
+    curvature terms are too small for a stable update, B is left untouched.
+    Avoids the np.outer/matmul temporaries and BLAS dispatch of the
+    general-n formula, which are pure overhead at n = 2.
+    """
+    sy = s[0] * y[0] + s[1] * y[1]
+    By0 = B[0, 0] * y[0] + B[0, 1] * y[1]
+    By1 = B[1, 0] * y[0] + B[1, 1] * y[1]
+    yBy = y[0] * By0 + y[1] * By1
+    if abs(sy) <= 1e-10 or abs(yBy) <= 1e-10:
+        return False
+    B[0, 0] += s[0] * s[0] / sy - By0 * By0 / yBy
+    B[0, 1] += s[0] * s[1] / sy - By0 * By1 / yBy
+    B[1, 0] += s[1] * s[0] / sy - By1 * By0 / yBy
+    B[1, 1] += s[1] * s[1] / sy - By1 * By1 / yBy
+    return True
+
+
+@njit(cache=True)
+def solve_2x2(H: NDArray[np.float64], g: NDArray[np.float64]) -> tuple:
+    """Solves H @ p = -g for 2x2 H by Cramer's rule.
+
+    Returns (p0, p1, det); the caller checks |det| to detect a singular
+    system instead of catching LinAlgError, and the two divisions replace
+    the LAPACK dispatch of np.linalg.solve.
+    """
+    det = H[0, 0] * H[1, 1] - H[0, 1] * H[1, 0]
+    if abs(det) < 1e-12:
+        return 0.0, 0.0, det
+    p0 = (-g[0] * H[1, 1] + g[1] * H[0, 1]) / det
+    p1 = (g[0] * H[1, 0] - g[1] * H[0, 0]) / det
+    return p0, p1, det
+
+
+def _grad_norm_sq(g: NDArray[np.float64]) -> float:
+    """Squared gradient norm without the np.linalg.norm dispatch + sqrt."""
+    if g.shape[0] == 2:
+        return g[0] * g[0] + g[1] * g[1]
+    return float(g @ g)
+
+
 # --- Wrapper for Evaluation Counting ---
 class FunctionWrapper:
-    """Wraps the objective function to count the number of evaluations."""
-    def __init__(self, fun: Callable[[NDArray[np.float64]], float]):
+    """Wraps the objective function to count the number of evaluations.
+
+    When an analytical gradient `grad_fun` is provided, it is used directly
+    (no extra cost-function evaluations); otherwise `grad` falls back to
+    central finite differences.
+
+    Repeat evaluations at identical points (e.g. the unchanged base point
+    across backtrack steps, or finite-difference probes shared between
+    neighbouring iterations) are served from a small LRU cache keyed by
+    the rounded (D, L) pair; `eval_count` counts logical calls (the UI
+    metric) while `cache_hits` tracks how many of those were free.
+    """
+    _CACHE_MAX = 16
+    def __init__(self, fun: Callable[[NDArray[np.float64]], float],
+                 grad_fun: Callable[[NDArray[np.float64]], NDArray[np.float64]] | None = None,
+                 hess_fun: Callable[[NDArray[np.float64]], NDArray[np.float64]] | None = None,
+                 batched_fun: Callable[[NDArray[np.float64]], NDArray[np.float64]] | None = None):
         self.fun = fun
+        self.grad_fun = grad_fun
+        self.hess_fun = hess_fun
+        self.batched_fun = batched_fun
         self.eval_count = 0
         self.grad_eval_count = 0
+        self.cache_hits = 0
+        self._cache: "OrderedDict[Any, float]" = OrderedDict()
 
     def __call__(self, x: NDArray[np.float64]) -> float:
         self.eval_count += 1
-        return self.fun(x)
+        # A rounded scalar tuple is cheaper to build and hash than
+        # x.tobytes() for the common 2-D case; 12 decimals keeps the
+        # 1e-8 finite-difference probes distinct.
+        if x.shape[0] == 2:
+            key = (round(x[0], 12), round(x[1], 12))
+        else:
+            key = x.tobytes()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return cached
+        value = self.fun(x)
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.popitem(last=False)
+        self._cache[key] = value
+        return value
 
     def grad(self, x: NDArray[np.float64], delta: float = 1e-8) -> NDArray[np.float64]:
         self.grad_eval_count += 1
-        grad = np.zeros_like(x, dtype=float)
+        if self.grad_fun is not None:
+            return self.grad_fun(x)
+        if self.batched_fun is not None:
+            return self.grad_vec(x, delta)
+        return self._grad_fd(x, delta)
+
+    def grad_vec(self, x: NDArray[np.float64], delta: float = 1e-8) -> NDArray[np.float64]:
+        """Central differences via two calls to the batched evaluator.
+
+        All 2n probe points are built at once with an identity-matrix
+        broadcast, replacing 2n Python-level evaluations with two
+        vectorized passes. Bypasses the memo cache; the probes are
+        counted as real evaluations.
+        """
+        n = len(x)
+        eye = np.eye(n)
+        f_plus = self.batched_fun(x + delta * eye)
+        f_minus = self.batched_fun(x - delta * eye)
+        self.eval_count += 2 * n
+        return (f_plus - f_minus) / (2 * delta)
+
+    def _grad_fd(self, x: NDArray[np.float64], delta: float = 1e-8) -> NDArray[np.float64]:
+        """Central finite differences (debug fallback when no analytical gradient).
+
+        Perturbs `x` in place (restoring each coordinate afterwards) instead
+        of allocating two copies per dimension.
+        """
+        grad = np.empty_like(x, dtype=float)
         for i in range(len(x)):
-            x_plus_delta = np.copy(x)
-            x_plus_delta[i] += delta
-            x_minus_delta = np.copy(x)
-            x_minus_delta[i] -= delta
-            grad[i] = (self(x_plus_delta) - self(x_minus_delta)) / (2 * delta)
+            xi = x[i]
+            x[i] = xi + delta
+            f_plus = self(x)
+            x[i] = xi - delta
+            f_minus = self(x)
+            x[i] = xi
+            grad[i] = (f_plus - f_minus) / (2 * delta)
         return grad
 
 # --- Base Optimizer Class ---
@@ -36,47 +152,71 @@ class BaseOptimizer(ABC):
         self.x = np.copy(x0)
         self.tol = tol
         self.max_iter = max_iter
-        self.history: List[NDArray[np.float64]] = [np.copy(x0)]
+        # History is written row-wise into a preallocated buffer instead of
+        # growing a list of per-iteration copies; optimize() returns the
+        # filled slice.
+        self.history: NDArray[np.float64] = np.empty((max_iter + 1, len(x0)))
+        self.history[0] = x0
+        self._hist_len: int = 1
         self.errors: List[float] = []
+        self._x_trial: NDArray[np.float64] = np.empty_like(self.x)
+
+    def _line_search(self, x: NDArray[np.float64], p: NDArray[np.float64],
+                     fx: float, pg: float) -> float:
+        """Performs backtracking line search to find a suitable step size.
 
-    def _line_search(self, x: NDArray[np.float64], p: NDArray[np.float64]) -> float:
-        """Performs backtracking line search to find a suitable step size."""
+        `fx` and `pg` are the cost f(x) and directional derivative p.g at
+        `x`, both already computed by the caller; only f(x + alpha*p)
+        varies across backtrack steps.
+        """
         alpha = 1.0
         c = 1e-4
         rho = 0.5
-        g = self.fun.grad(x)
-        
+        slope = c * pg
+
         # The check for the descent direction has been moved to the `optimize` loop.
-        while self.fun(x + alpha * p) > self.fun(x) + c * alpha * (p @ g):
+        x_trial = self._x_trial
+        while True:
+            np.multiply(p, alpha, out=x_trial)
+            x_trial += x
+            if self.fun(x_trial) <= fx + alpha * slope:
+                return alpha
             alpha *= rho
             if alpha < 1e-10:
                 return 1e-10
-        return alpha
 
     def optimize(self) -> Dict[str, Any]:
         """Main optimization loop."""
         k = 0
+        tol2 = self.tol * self.tol
         g = self.fun.grad(self.x)
-        self.errors.append(float(np.linalg.norm(g)))
+        g2 = _grad_norm_sq(g)
+        fx = self.fun(self.x)
+        self.errors.append(math.sqrt(g2))
 
-        while np.linalg.norm(g) > self.tol and k < self.max_iter:
+        while g2 > tol2 and k < self.max_iter:
             p = self._get_direction(g)
-            
+
             # Ensures that p is a descent direction.
             # If not, use the gradient direction as a fallback for the iteration.
-            if np.dot(p, g) >= 0:
+            pg = float(np.dot(p, g))
+            if pg >= 0:
                 p = -g
+                pg = -g2
 
-            alpha = self._line_search(self.x, p)
+            alpha = self._line_search(self.x, p, fx, pg)
             self.x += alpha * p
-            self.history.append(np.copy(self.x))
+            self.history[self._hist_len] = self.x
+            self._hist_len += 1
             g = self.fun.grad(self.x)
-            self.errors.append(float(np.linalg.norm(g)))
+            g2 = _grad_norm_sq(g)
+            fx = self.fun(self.x)
+            self.errors.append(math.sqrt(g2))
             k += 1
 
         return {
-            "x": self.x, "fun": self.fun(self.x), "grad": g,
-            "history": self.history, "errors": self.errors,
+            "x": self.x, "fun": fx, "grad": g,
+            "history": self.history[:self._hist_len], "errors": self.errors,
             "fun_evals": self.fun.eval_count
         }
 
@@ -94,22 +234,70 @@ class SteepestDescent(BaseOptimizer):
 class Newton(BaseOptimizer):
     """Newton's method with line search and fallback."""
     def _get_hessian(self, x: NDArray[np.float64], delta: float = 1e-5) -> NDArray[np.float64]:
+        if self.fun.hess_fun is not None:
+            return self.fun.hess_fun(x)
+        if self.fun.batched_fun is not None:
+            # Build all 4n^2 perturbations up front and evaluate them in a
+            # single batched pass.
+            n = len(x)
+            P = np.tile(x, (4 * n * n, 1))
+            r = 0
+            for i in range(n):
+                for j in range(n):
+                    for si, sj in ((delta, delta), (delta, -delta),
+                                   (-delta, delta), (-delta, -delta)):
+                        P[r, i] += si
+                        P[r, j] += sj
+                        r += 1
+            f = self.fun.batched_fun(P)
+            self.fun.eval_count += 4 * n * n
+            f = f.reshape(n, n, 4)
+            return (f[:, :, 0] - f[:, :, 1] - f[:, :, 2] + f[:, :, 3]) / (4 * delta**2)
+        # Finite-difference fallback when no analytical Hessian is available.
+        # One buffer is perturbed in place (and restored) instead of
+        # allocating four copies of x per matrix entry.
         n = len(x)
         H = np.zeros((n, n), dtype=float)
+        xb = x.copy()
         for i in range(n):
             for j in range(n):
-                x_pp = x.copy(); x_pp[i] += delta; x_pp[j] += delta
-                x_pm = x.copy(); x_pm[i] += delta; x_pm[j] -= delta
-                x_mp = x.copy(); x_mp[i] -= delta; x_mp[j] += delta
-                x_mm = x.copy(); x_mm[i] -= delta; x_mm[j] -= delta
-                H[i, j] = (self.fun(x_pp) - self.fun(x_pm) - self.fun(x_mp) + self.fun(x_mm)) / (4 * delta**2)
+                xi, xj = xb[i], xb[j]
+                # Increments accumulate so the i == j (diagonal) entries see
+                # +/-2*delta, exactly like the old per-copy version.
+                xb[i] += delta; xb[j] += delta
+                f_pp = self.fun(xb)
+                xb[i] = xi; xb[j] = xj
+                xb[i] += delta; xb[j] -= delta
+                f_pm = self.fun(xb)
+                xb[i] = xi; xb[j] = xj
+                xb[i] -= delta; xb[j] += delta
+                f_mp = self.fun(xb)
+                xb[i] = xi; xb[j] = xj
+                xb[i] -= delta; xb[j] -= delta
+                f_mm = self.fun(xb)
+                xb[i] = xi; xb[j] = xj
+                H[i, j] = (f_pp - f_pm - f_mp + f_mm) / (4 * delta**2)
         return H
 
     def _get_direction(self, g: NDArray[np.float64]) -> NDArray[np.float64]:
+        # Outside the positive quadrant the cost is flat at inf; the Hessian
+        # carries no curvature information, so fall back to -g immediately.
+        if self.x[0] <= 0 or self.x[1] <= 0:
+            return -g
         H = self._get_hessian(self.x)
+        if len(g) == 2:
+            p0, p1, det = solve_2x2(H, g)
+            # Fallback to gradient if the Hessian is singular
+            if abs(det) < 1e-12:
+                return -g
+            # Safety check: if the step is too large, the Hessian
+            # is likely ill-conditioned. Use the gradient as a fallback.
+            if math.sqrt(p0 * p0 + p1 * p1) > 100:
+                return -g
+            return np.array([p0, p1])
         try:
             # Using 'solve' is numerically more stable and efficient than 'inv'
-            p = np.linalg.solve(H, -g).astype(np.float64)
+            p = np.linalg.solve(H, -g)
             # Safety check: if the step is too large, the Hessian
             # is likely ill-conditioned. Use the gradient as a fallback.
             if np.linalg.norm(p) > 100:
@@ -126,46 +314,63 @@ class DFP(BaseOptimizer):
 
     def optimize(self) -> Dict[str, Any]:
         k = 0
+        tol2 = self.tol * self.tol
         g = self.fun.grad(self.x)
-        self.errors.append(float(np.linalg.norm(g)))
+        g2 = _grad_norm_sq(g)
+        fx = self.fun(self.x)
+        self.errors.append(math.sqrt(g2))
+
+        n2 = len(self.x) == 2
+        while g2 > tol2 and k < self.max_iter:
+            if n2:
+                # Inline -B @ g for the 2x2 case (no BLAS matvec)
+                p = np.array([-(self.B[0, 0] * g[0] + self.B[0, 1] * g[1]),
+                              -(self.B[1, 0] * g[0] + self.B[1, 1] * g[1])])
+            else:
+                p = -self.B @ g
 
-        while np.linalg.norm(g) > self.tol and k < self.max_iter:
-            p = -self.B @ g
-            
             # Safety check: ensure p is a descent direction.
             # If the B matrix is not positive definite, the direction might be wrong.
-            if np.dot(p, g) >= 0:
+            pg = float(np.dot(p, g))
+            if pg >= 0:
                 # Fallback to steepest descent and reset the Hessian approximation
                 p = -g
+                pg = -g2
                 self.B = np.eye(len(self.x))
-            
+
             x_old = self.x
             g_old = g
-            
-            alpha = self._line_search(self.x, p)
+
+            alpha = self._line_search(self.x, p, fx, pg)
             self.x = self.x + alpha * p
-            self.history.append(np.copy(self.x))
-            
+            self.history[self._hist_len] = self.x
+            self._hist_len += 1
+
             g = self.fun.grad(self.x)
-            self.errors.append(float(np.linalg.norm(g)))
+            g2 = _grad_norm_sq(g)
+            fx = self.fun(self.x)
+            self.errors.append(math.sqrt(g2))
 
             s = self.x - x_old
             y = g - g_old
 
-            s_dot_y = s @ y
-            y_B_y = y @ self.B @ y
+            # Update the Hessian approximation (B) only if it is numerically
+            # stable; dfp_update handles that check for the 2x2 fast path.
+            if n2:
+                dfp_update(self.B, s, y)
+            else:
+                s_dot_y = s @ y
+                y_B_y = y @ self.B @ y
+                if np.abs(s_dot_y) > 1e-10 and np.abs(y_B_y) > 1e-10:
+                    term1 = np.outer(s, s) / s_dot_y
+                    term2 = - (self.B @ np.outer(y, y) @ self.B) / y_B_y
+                    self.B += term1 + term2
 
-            # Update the Hessian approximation (B) only if it is numerically stable
-            if np.abs(s_dot_y) > 1e-10 and np.abs(y_B_y) > 1e-10:
-                term1 = np.outer(s, s) / s_dot_y
-                term2 = - (self.B @ np.outer(y, y) @ self.B) / y_B_y
-                self.B += term1 + term2
-            
             k += 1
 
         return {
-            "x": self.x, "fun": self.fun(self.x), "grad": g,
-            "history": self.history, "errors": self.errors,
+            "x": self.x, "fun": fx, "grad": g,
+            "history": self.history[:self._hist_len], "errors": self.errors,
             "fun_evals": self.fun.eval_count
         }
 